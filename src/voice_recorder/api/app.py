@@ -4,7 +4,7 @@ Voice recorder application entry point.
 
 import signal
 import sys
-import time
+import threading
 from typing import Optional
 
 
@@ -81,6 +81,9 @@ class VoiceRecorderApp:
             console=self.console,
         )
 
+        # Set by stop() to end the keep-alive loop in start()
+        self._stop_event = threading.Event()
+
         # Set up signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -103,15 +106,19 @@ class VoiceRecorderApp:
         self.console.info(f"Transcription: {self.config.transcription.mode.value}")
         self.console.info(f"Auto-paste: {self.config.general.auto_paste}")
 
+        # Allow a stopped app to be started again
+        self._stop_event.clear()
+
         try:
             self.voice_recorder_service.start()
             self.console.info("Voice recorder started successfully!")
             self.console.info("Press Ctrl+C to stop")
 
-            # Keep the application running
+            # Keep the application running until stop() sets the event; the
+            # timeout keeps the main thread responsive to Ctrl+C
             try:
-                while True:
-                    time.sleep(1)
+                while not self._stop_event.wait(1):
+                    pass
             except KeyboardInterrupt:
                 pass
         except Exception as e:
@@ -121,6 +128,7 @@ class VoiceRecorderApp:
     def stop(self):
         """Stop the voice recorder application."""
         self.console.info("Stopping voice recorder...")
+        self._stop_event.set()
         try:
             self.voice_recorder_service.stop()
             self.console.info("Voice recorder stopped successfully!")
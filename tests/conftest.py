@@ -3,19 +3,29 @@ Pytest configuration and shared fixtures.
 """
 
 import os
-import tempfile
-from typing import Generator
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
+from src.voice_recorder.domain.interfaces import ConsoleInterface
 from src.voice_recorder.domain.models import (
     ApplicationConfig,
     AudioConfig,
     ControlsConfig,
+    RecordingSession,
     TranscriptionResult,
 )
 
+_FIXED_TIME = datetime(2024, 1, 1)
+
+
+def pytest_report_header(config: pytest.Config) -> str:
+    """Report which pytest-xdist worker is running this session."""
+    return f"xdist worker: {os.environ.get('PYTEST_XDIST_WORKER', 'master')}"
+
 
 @pytest.fixture
 def test_config() -> ApplicationConfig:
@@ -27,11 +37,11 @@ def test_config() -> ApplicationConfig:
 
 
 @pytest.fixture
-def mock_audio_recorder() -> Mock:
+def mock_audio_recorder(tmp_path: Path) -> Mock:
     """Provide a mock audio recorder."""
     mock = Mock()
     mock.start_recording.return_value = "test_session"
-    mock.stop_recording.return_value = "test_audio.wav"
+    mock.stop_recording.return_value = str(tmp_path / "test_audio.wav")
     mock.is_recording.return_value = False
     return mock
 
@@ -67,64 +77,26 @@ def mock_text_paster() -> Mock:
 @pytest.fixture
 def mock_session_manager() -> Mock:
     """Provide a mock session manager."""
-    from datetime import datetime
-    from src.voice_recorder.domain.models import RecordingSession
-
     mock = Mock()
-    mock_session = RecordingSession(id="test_session", start_time=datetime.now())
+    mock_session = RecordingSession(id="test_session", start_time=_FIXED_TIME)
     mock.create_session = Mock(return_value=mock_session)
     mock.update_session = Mock()
-    mock.get_session = Mock()
-    return mock
-
-
-@pytest.fixture
-def mock_console() -> Mock:
-    """Provide a mock console interface."""
-    mock = Mock()
-    # Mock all the ConsoleInterface methods
-    mock.info = Mock()
-    mock.error = Mock()
-    mock.warning = Mock()
-    mock.debug = Mock()
+    # Look-ups by id return the created session, as a real manager would
+    mock.get_session = Mock(return_value=mock_session)
     return mock
 
 
 @pytest.fixture
-def temp_audio_file() -> Generator[str, None, None]:
-    """Provide a temporary audio file for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        temp_file = f.name
+def mock_console() -> SimpleNamespace:
+    """Provide a no-op console for tests that don't inspect console output."""
 
-    yield temp_file
+    def _noop(*args, **kwargs) -> None:
+        return None
 
-    # Clean up
-    if os.path.exists(temp_file):
-        os.unlink(temp_file)
+    return SimpleNamespace(info=_noop, error=_noop, warning=_noop, debug=_noop)
 
 
 @pytest.fixture
-def sample_audio_data() -> bytes:
-    """Provide sample audio data for testing."""
-    # Create a simple 1-second 16kHz mono WAV file
-    import tempfile
-    import wave
-
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-        temp_file = f.name
-
-    try:
-        with wave.open(temp_file, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(16000)
-            # Generate 1 second of silence
-            wf.writeframes(b"\x00\x00" * 16000)
-
-        with open(temp_file, "rb") as f:
-            data = f.read()
-
-        return data
-    finally:
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
+def spy_console() -> Mock:
+    """Provide a recording console for tests that assert on console output."""
+    return Mock(spec=ConsoleInterface)
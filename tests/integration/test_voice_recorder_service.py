@@ -0,0 +1,119 @@
+"""
+Integration tests for the voice recorder service workflow.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.voice_recorder.domain.models import (
+    GeneralConfig,
+    RecordingState,
+    TranscriptionResult,
+)
+from src.voice_recorder.services.voice_recorder_service import VoiceRecorderService
+
+BASIC_KEY = SimpleNamespace(char=None, name="shift_r")
+
+
+@pytest.fixture
+def voice_recorder_service(
+    test_config,
+    mock_audio_recorder,
+    mock_transcription_service,
+    mock_hotkey_listener,
+    mock_text_paster,
+    mock_session_manager,
+    spy_console,
+) -> VoiceRecorderService:
+    """Provide a voice recorder service wired with mock components."""
+    return VoiceRecorderService(
+        audio_recorder=mock_audio_recorder,
+        transcription_service=mock_transcription_service,
+        hotkey_listener=mock_hotkey_listener,
+        text_paster=mock_text_paster,
+        session_manager=mock_session_manager,
+        config=test_config,
+        console=spy_console,
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "release,transcript,auto_paste,expect_paste,expected_state",
+    [
+        pytest.param(
+            False,
+            "Test transcription result",
+            True,
+            False,
+            RecordingState.RECORDING,
+            id="press",
+        ),
+        pytest.param(
+            True,
+            "Test transcription result",
+            True,
+            True,
+            RecordingState.COMPLETED,
+            id="full_workflow",
+        ),
+        pytest.param(True, "", True, False, RecordingState.ERROR, id="no_transcript"),
+        pytest.param(
+            True,
+            "Test transcription result",
+            False,
+            False,
+            RecordingState.COMPLETED,
+            id="auto_paste_disabled",
+        ),
+    ],
+)
+def test_recording_flow(
+    voice_recorder_service,
+    release,
+    transcript,
+    auto_paste,
+    expect_paste,
+    expected_state,
+):
+    """Test the press/release recording workflow end to end."""
+    service = voice_recorder_service
+    service.config = service.config.model_copy(
+        update={"general": GeneralConfig(auto_paste=auto_paste)}
+    )
+    service.transcription_service.transcribe.return_value = TranscriptionResult(
+        text=transcript
+    )
+
+    service.start()
+    service.hotkey_listener.start_listening.assert_called_once()
+
+    service._on_any_key_press(BASIC_KEY)
+    service.audio_recorder.start_recording.assert_called_once()
+    session = service.current_session
+    assert session is not None
+
+    if release:
+        service._on_any_key_release(BASIC_KEY)
+        service._processing_thread.join(timeout=5.0)
+        assert not service._processing_thread.is_alive()
+        service.audio_recorder.stop_recording.assert_called_once_with("test_session")
+        service.transcription_service.transcribe.assert_called_once()
+        assert service.is_recording is False
+    else:
+        assert service.is_recording is True
+
+    # The service swallows processing errors, so check the recorded outcome
+    service.console.error.assert_not_called()
+    update_session = service.session_manager.update_session
+    assert update_session.call_args.args[0] is session
+    assert session.state is expected_state
+    expected_transcript = (
+        transcript if expected_state is RecordingState.COMPLETED else None
+    )
+    assert session.transcript == expected_transcript
+
+    assert service.text_paster.paste_text.called is expect_paste
+    if expect_paste:
+        service.text_paster.paste_text.assert_called_once_with(transcript)
@@ -0,0 +1,3 @@
+"""
+Shared test doubles for the voice recorder test suite.
+"""
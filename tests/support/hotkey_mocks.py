@@ -0,0 +1,32 @@
+"""
+Hotkey listener test doubles.
+"""
+
+
+class MockHotkeyListener:
+    """Mock hotkey listener for testing."""
+
+    def __init__(self):
+        self.is_listening = False
+        self.on_press_callback = None
+        self.on_release_callback = None
+
+    def start_listening(self, on_press, on_release):
+        """Start listening for hotkey events."""
+        self.is_listening = True
+        self.on_press_callback = on_press
+        self.on_release_callback = on_release
+
+    def stop_listening(self):
+        """Stop listening for hotkey events."""
+        self.is_listening = False
+
+    def simulate_key_press(self, key):
+        """Simulate a key press event."""
+        if self.on_press_callback:
+            self.on_press_callback(key)
+
+    def simulate_key_release(self, key):
+        """Simulate a key release event."""
+        if self.on_release_callback:
+            self.on_release_callback(key)
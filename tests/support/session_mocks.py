@@ -0,0 +1,58 @@
+"""
+Session manager test doubles.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from src.voice_recorder.domain.models import RecordingSession, RecordingState
+
+_FROZEN = datetime(2024, 1, 1)
+
+
+class MockSessionManager:
+    """Mock session manager for testing."""
+
+    def __init__(self, clock: Callable[[], datetime] = lambda: _FROZEN):
+        self._clock = clock
+        self.sessions: Dict[str, RecordingSession] = {}
+        self.create_count = 0
+        self.update_count = 0
+        self.get_count = 0
+        self.delete_count = 0
+        self.clear_count = 0
+
+    def create_session(self) -> RecordingSession:
+        """Create a new recording session."""
+        self.create_count += 1
+        session_id = f"mock_session_{self.create_count}"
+        session = RecordingSession(
+            id=session_id, start_time=self._clock(), state=RecordingState.IDLE
+        )
+        self.sessions[session_id] = session
+        return session
+
+    def update_session(self, session: RecordingSession) -> None:
+        """Update session information."""
+        self.update_count += 1
+        if session.id in self.sessions:
+            self.sessions[session.id] = session
+
+    def get_session(self, session_id: str) -> Optional[RecordingSession]:
+        """Get session by ID."""
+        self.get_count += 1
+        return self.sessions.get(session_id)
+
+    def get_all_sessions(self) -> List[RecordingSession]:
+        """Get all sessions."""
+        return list(self.sessions.values())
+
+    def delete_session(self, session_id: str) -> bool:
+        """Delete a session."""
+        self.delete_count += 1
+        return self.sessions.pop(session_id, None) is not None
+
+    def clear_sessions(self) -> None:
+        """Clear all sessions."""
+        self.clear_count += 1
+        self.sessions.clear()
@@ -0,0 +1,16 @@
+"""
+Transcription service test doubles.
+"""
+
+from src.voice_recorder.domain.models import TranscriptionResult
+
+
+class MockTranscriptionService:
+    """Mock transcription service for testing."""
+
+    def __init__(self, mock_text: str = "Test transcription"):
+        self.mock_text = mock_text
+
+    def transcribe(self, audio_file_path: str):
+        """Mock transcription method."""
+        return TranscriptionResult(text=self.mock_text, confidence=0.95, duration=1.0)
@@ -0,0 +1,66 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import sys
+import types
+from unittest.mock import Mock
+
+import pytest
+
+from src.voice_recorder.domain.models import (
+    ApplicationConfig,
+    OpenAITranscriptionConfig,
+    TranscriptionConfig,
+    TranscriptionMode,
+)
+from src.voice_recorder.infrastructure.transcription.simple_factory import (
+    SimpleTranscriptionServiceFactory,
+)
+
+
+def _stub_service(*args, **kwargs) -> Mock:
+    """Stand in for the transcription factory's service constructors."""
+    return Mock()
+
+
+@pytest.fixture
+def openai_config() -> TranscriptionConfig:
+    """Provide an OpenAI-mode transcription configuration with an API key."""
+    return TranscriptionConfig(
+        mode=TranscriptionMode.OPENAI,
+        openai=OpenAITranscriptionConfig(api_key="test-key", whisper_model="whisper-1"),
+    )
+
+
+@pytest.fixture
+def openai_app_config(openai_config) -> ApplicationConfig:
+    """Provide a valid OpenAI-mode application configuration."""
+    return ApplicationConfig(transcription=openai_config)
+
+
+@pytest.fixture(scope="class")
+def _stub_openai():
+    """Install a fake openai package whose client is shared by the class."""
+    fake = types.ModuleType("openai")
+    fake.OpenAI = Mock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "openai", fake)
+        yield fake.OpenAI.return_value
+
+
+@pytest.fixture
+def _stub_factory(monkeypatch):
+    """Replace transcription service creation with mocks for the test."""
+    monkeypatch.setattr(
+        SimpleTranscriptionServiceFactory, "create_service", _stub_service
+    )
+    monkeypatch.setattr(
+        SimpleTranscriptionServiceFactory, "create_enhanced_service", _stub_service
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Provide a session-wide directory for tests that never write to it."""
+    return tmp_path_factory.mktemp("cm_ro")
@@ -2,284 +2,144 @@
 Unit tests for the application module.
 """
 
-import os
-import tempfile
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import Mock
 
 import pytest
 
 from src.voice_recorder.api.app import VoiceRecorderApp, create_app, main
-from src.voice_recorder.domain.models import ApplicationConfig
+from src.voice_recorder.domain.models import (
+    ApplicationConfig,
+    LocalTranscriptionConfig,
+    OpenAITranscriptionConfig,
+    TranscriptionConfig,
+    TranscriptionMode,
+)
+from src.voice_recorder.infrastructure.config_manager import ConfigManager
+
+pytestmark = pytest.mark.usefixtures("_stub_factory")
 
 
 class TestVoiceRecorderApp:
     """Test cases for VoiceRecorderApp."""
 
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory"
+    @pytest.fixture(autouse=True)
+    def _api_key(self, monkeypatch):
+        """Provide an OpenAI API key in the environment."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    @pytest.mark.parametrize(
+        "mode,sub,pass_config,has_api_key",
+        [
+            pytest.param(
+                TranscriptionMode.OPENAI,
+                OpenAITranscriptionConfig(api_key="test-key"),
+                True,
+                True,
+                id="with_config",
+            ),
+            pytest.param(
+                TranscriptionMode.OPENAI,
+                OpenAITranscriptionConfig(api_key="test-key"),
+                False,
+                True,
+                id="without_config",
+            ),
+            pytest.param(
+                TranscriptionMode.LOCAL,
+                LocalTranscriptionConfig(whisper_model="small"),
+                False,
+                False,
+                id="without_api_key",
+            ),
+        ],
     )
-    def test_init_with_config(self, mock_factory_class):
-        """Test VoiceRecorderApp initialization with config."""
-        mock_service = Mock()
-        mock_enhanced_service = Mock()
-        mock_factory_instance = Mock()
-        mock_factory_instance.create_service.return_value = mock_service
-        mock_factory_instance.create_enhanced_service.return_value = (
-            mock_enhanced_service
-        )
-        mock_factory_class.return_value = mock_factory_instance
-
-        # Create config with valid API key
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            OpenAITranscriptionConfig,
+    def test_init(self, mode, sub, pass_config, has_api_key, monkeypatch):
+        """Test VoiceRecorderApp initialization with and without config/API key."""
+        if not has_api_key:
+            monkeypatch.delenv("OPENAI_API_KEY")
+        config = ApplicationConfig(
+            transcription=TranscriptionConfig(mode=mode, **{mode.value: sub})
         )
+        monkeypatch.setattr(ConfigManager, "load_config", lambda self: config)
 
-        transcription_config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(api_key="test-key"),
-        )
-        config = ApplicationConfig(transcription=transcription_config)
-        app = VoiceRecorderApp(config)
+        app = VoiceRecorderApp(config if pass_config else None)
         assert app.config == config
 
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_enhanced_service"
-    )
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_service"
-    )
-    @patch("src.voice_recorder.infrastructure.config_manager.ConfigManager.load_config")
-    def test_init_without_config(
-        self, mock_load_config, mock_create_service, mock_create_enhanced_service
-    ):
-        """Test VoiceRecorderApp initialization without config."""
-        mock_service = Mock()
-        mock_enhanced_service = Mock()
-        mock_create_service.return_value = mock_service
-        mock_create_enhanced_service.return_value = mock_enhanced_service
-
-        # Mock config loading to return a valid config
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            OpenAITranscriptionConfig,
-        )
-
-        transcription_config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(api_key="test-key"),
-        )
-        mock_config = ApplicationConfig(transcription=transcription_config)
-        mock_load_config.return_value = mock_config
-
-        app = VoiceRecorderApp()
-        assert isinstance(app.config, ApplicationConfig)
-
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_enhanced_service"
-    )
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_service"
-    )
-    @patch("src.voice_recorder.infrastructure.config_manager.ConfigManager.load_config")
-    def test_init_without_api_key(
-        self, mock_load_config, mock_create_service, mock_create_enhanced_service
-    ):
-        """Test VoiceRecorderApp initialization without API key."""
-        mock_service = Mock()
-        mock_enhanced_service = Mock()
-        mock_create_service.return_value = mock_service
-        mock_create_enhanced_service.return_value = mock_enhanced_service
-
-        # Mock config loading to return a local config (no API key needed)
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            LocalTranscriptionConfig,
-        )
-
-        transcription_config = TranscriptionConfig(
-            mode=TranscriptionMode.LOCAL,
-            local=LocalTranscriptionConfig(whisper_model="small"),
-        )
-        mock_config = ApplicationConfig(transcription=transcription_config)
-        mock_load_config.return_value = mock_config
-
-        with patch.dict(os.environ, {}, clear=True):
-            # The app should still initialize even without API key
-            # since it uses the factory pattern now
-            app = VoiceRecorderApp()
-            assert isinstance(app.config, ApplicationConfig)
-
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_enhanced_service"
-    )
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_service"
-    )
-    @patch("src.voice_recorder.infrastructure.config_manager.ConfigManager.load_config")
-    def test_signal_handler(
-        self, mock_load_config, mock_create_service, mock_create_enhanced_service
-    ):
+    def test_signal_handler(self, openai_app_config, monkeypatch):
         """Test signal handler."""
-        mock_service = Mock()
-        mock_enhanced_service = Mock()
-        mock_create_service.return_value = mock_service
-        mock_create_enhanced_service.return_value = mock_enhanced_service
-
-        # Mock config loading
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            OpenAITranscriptionConfig,
-        )
-
-        transcription_config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(api_key="test-key"),
+        monkeypatch.setattr(
+            ConfigManager, "load_config", lambda self: openai_app_config
         )
-        mock_config = ApplicationConfig(transcription=transcription_config)
-        mock_load_config.return_value = mock_config
 
         app = VoiceRecorderApp()
-        with patch.object(app, "stop") as mock_stop:
-            with patch("sys.exit") as mock_exit:
-                app._signal_handler(None, None)
-                mock_stop.assert_called_once()
-                mock_exit.assert_called_once_with(0)
-
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_enhanced_service"
-    )
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_service"
-    )
-    @patch("src.voice_recorder.infrastructure.config_manager.ConfigManager.load_config")
-    def test_start_and_stop(
-        self, mock_load_config, mock_create_service, mock_create_enhanced_service
-    ):
+        mock_stop = Mock()
+        monkeypatch.setattr(app, "stop", mock_stop)
+        with pytest.raises(SystemExit) as excinfo:
+            app._signal_handler(None, None)
+        mock_stop.assert_called_once()
+        assert excinfo.value.code == 0
+
+    def test_start_and_stop(self, openai_app_config, monkeypatch):
         """Test start and stop methods."""
-        mock_service = Mock()
-        mock_enhanced_service = Mock()
-        mock_create_service.return_value = mock_service
-        mock_create_enhanced_service.return_value = mock_enhanced_service
-
-        # Mock config loading
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            OpenAITranscriptionConfig,
-        )
-
-        transcription_config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(api_key="test-key"),
+        monkeypatch.setattr(
+            ConfigManager, "load_config", lambda self: openai_app_config
         )
-        mock_config = ApplicationConfig(transcription=transcription_config)
-        mock_load_config.return_value = mock_config
 
         app = VoiceRecorderApp()
 
-        # Mock the voice recorder service
+        # Mock the voice recorder service and signal once it has started
+        started = threading.Event()
         mock_service = Mock()
+        mock_service.start.side_effect = started.set
         app.voice_recorder_service = mock_service
 
-        # Test start
-        with patch("time.sleep", side_effect=KeyboardInterrupt):
-            app.start()
-            mock_service.start.assert_called_once()
+        # A stop from an earlier run must not end the next start() at once
+        app.stop()
+        mock_service.stop.reset_mock()
 
-        # Test stop
+        thread = threading.Thread(target=app.start, daemon=True)
+        thread.start()
+        assert started.wait(timeout=5.0)
+        assert thread.is_alive()
+
+        # stop() ends the keep-alive loop in start()
         app.stop()
+        thread.join(timeout=5.0)
+        assert not thread.is_alive()
+        mock_service.start.assert_called_once()
         mock_service.stop.assert_called_once()
 
 
 class TestCreateApp:
     """Test cases for create_app function."""
 
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_enhanced_service"
-    )
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_service"
-    )
-    def test_create_app_with_config(
-        self, mock_create_service, mock_create_enhanced_service
-    ):
-        """Test create_app with config."""
-        mock_service = Mock()
-        mock_enhanced_service = Mock()
-        mock_create_service.return_value = mock_service
-        mock_create_enhanced_service.return_value = mock_enhanced_service
-
-        # Create config with valid API key
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            OpenAITranscriptionConfig,
-        )
-
-        transcription_config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(api_key="test-key"),
-        )
-        config = ApplicationConfig(transcription=transcription_config)
-        app = create_app(config)
-        assert isinstance(app, VoiceRecorderApp)
-        assert app.config == config
-
-    @patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_enhanced_service"
-    )
-    @patch(
-        "src.voice_recorder.infrastructure.transcription.simple_factory.SimpleTranscriptionServiceFactory.create_service"
-    )
-    @patch("src.voice_recorder.infrastructure.config_manager.ConfigManager.load_config")
-    def test_create_app_without_config(
-        self, mock_load_config, mock_create_service, mock_create_enhanced_service
-    ):
-        """Test create_app without config."""
-        mock_service = Mock()
-        mock_enhanced_service = Mock()
-        mock_create_service.return_value = mock_service
-        mock_create_enhanced_service.return_value = mock_enhanced_service
-
-        # Mock config loading
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            OpenAITranscriptionConfig,
-        )
+    @pytest.fixture(autouse=True)
+    def _api_key(self, monkeypatch):
+        """Provide an OpenAI API key in the environment."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
 
-        transcription_config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(api_key="test-key"),
+    @pytest.mark.parametrize("pass_config", [True, False], ids=["with", "without"])
+    def test_create_app(self, pass_config, openai_app_config, monkeypatch):
+        """Test create_app with and without config."""
+        monkeypatch.setattr(
+            ConfigManager, "load_config", lambda self: openai_app_config
         )
-        mock_config = ApplicationConfig(transcription=transcription_config)
-        mock_load_config.return_value = mock_config
 
-        app = create_app()
+        app = create_app(openai_app_config if pass_config else None)
         assert isinstance(app, VoiceRecorderApp)
-        assert isinstance(app.config, ApplicationConfig)
+        assert app.config == openai_app_config
 
 
 class TestMain:
     """Test cases for main function."""
 
-    @patch("src.voice_recorder.cli.commands.main")
-    def test_main(self, mock_cli_main):
+    def test_main(self, monkeypatch):
         """Test main function."""
-        mock_cli_main.return_value = 0
+        mock_cli_main = Mock(return_value=0)
+        monkeypatch.setattr("src.voice_recorder.cli.commands.main", mock_cli_main)
 
-        with patch("sys.exit") as mock_exit:
+        with pytest.raises(SystemExit) as excinfo:
             main()
-            mock_cli_main.assert_called_once()
-            mock_exit.assert_called_once_with(0)
+        mock_cli_main.assert_called_once()
+        assert excinfo.value.code == 0
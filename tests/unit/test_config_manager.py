@@ -2,204 +2,189 @@
 Unit tests for configuration manager.
 """
 
-import os
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from src.voice_recorder.domain.models import ApplicationConfig, TranscriptionMode
 from src.voice_recorder.infrastructure.config_manager import ConfigManager
 
+_VALID_INI = """
+[audio]
+sample_rate = 16000
+channels = 1
+format = wav
+chunk_size = 1024
+
+[transcription]
+mode = openai
+
+[transcription.openai]
+api_key = test-key
+
+[controls]
+basic_key = shift_r
+enhanced_key = ctrl_l
+
+[general]
+auto_paste = true
+"""
+
+_GENERAL_INI = """
+[general]
+auto_paste = true
+"""
+
+_LOW_SAMPLE_RATE_INI = """
+[audio]
+sample_rate = 8000
+"""
+
 
 class TestConfigManager:
     """Test cases for ConfigManager."""
 
-    def test_init_default_config_dir(self):
+    def test_init_default_config_dir(self, tmp_path):
         """Test initialization with default config directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch("pathlib.Path.home") as mock_home:
-                mock_home.return_value = Path(temp_dir)
-                config_manager = ConfigManager()
+        with patch.object(Path, "home") as mock_home:
+            mock_home.return_value = tmp_path
+            config_manager = ConfigManager()
 
-                expected_config_dir = Path(temp_dir) / ".voicerecorder"
-                assert config_manager.config_dir == expected_config_dir
-                assert config_manager.config_file == expected_config_dir / "config.ini"
+            expected_config_dir = tmp_path / ".voicerecorder"
+            assert config_manager.config_dir == expected_config_dir
+            assert config_manager.config_file == expected_config_dir / "config.ini"
 
-    def test_init_custom_config_dir(self):
+    def test_init_custom_config_dir(self, shared_tmp):
         """Test initialization with custom config directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(shared_tmp))
 
-            assert config_manager.config_dir == Path(temp_dir)
-            assert config_manager.config_file == Path(temp_dir) / "config.ini"
+        assert config_manager.config_dir == shared_tmp
+        assert config_manager.config_file == shared_tmp / "config.ini"
 
-    def test_ensure_config_dir(self):
+    def test_ensure_config_dir(self, tmp_path):
         """Test config directory creation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
-            config_manager._ensure_config_dir()
+        config_manager = ConfigManager(str(tmp_path))
+        config_manager._ensure_config_dir()
 
-            assert Path(temp_dir).exists()
+        assert tmp_path.exists()
 
-    def test_config_exists_true(self):
+    def test_config_exists_true(self, tmp_path):
         """Test config_exists when file exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(tmp_path))
 
-            # Create a dummy config file
-            config_file = Path(temp_dir) / "config.ini"
-            config_file.write_text("[test]\nkey=value")
+        # Create a dummy config file
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("[test]\nkey=value")
 
-            assert config_manager.config_exists()
+        assert config_manager.config_exists()
 
-    def test_config_exists_false(self):
+    def test_config_exists_false(self, shared_tmp):
         """Test config_exists when file doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(shared_tmp))
 
-            assert not config_manager.config_exists()
+        assert not config_manager.config_exists()
 
-    def test_load_config_file_not_exists(self):
+    def test_load_config_file_not_exists(self, shared_tmp):
         """Test load_config when file doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(shared_tmp))
 
-            with pytest.raises(FileNotFoundError):
-                config_manager.load_config()
+        with pytest.raises(FileNotFoundError):
+            config_manager.load_config()
 
-    def test_load_config_file_exists(self):
+    def test_load_config_file_exists(self, tmp_path):
         """Test load_config when file exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
-
-            # Create a valid config file
-            config_content = """
-[audio]
-sample_rate = 16000
-channels = 1
-format = wav
-chunk_size = 1024
-
-[transcription]
-mode = openai
-
-[transcription.openai]
-api_key = test-key
+        config_manager = ConfigManager(str(tmp_path))
 
-[controls]
-basic_key = shift_r
-enhanced_key = ctrl_l
-
-[general]
-auto_paste = true
-"""
-            config_file = Path(temp_dir) / "config.ini"
-            config_file.write_text(config_content)
+        config_file = tmp_path / "config.ini"
+        config_file.write_text(_VALID_INI)
 
-            config = config_manager.load_config()
+        config = config_manager.load_config()
 
-            assert isinstance(config, ApplicationConfig)
-            assert config.audio.sample_rate == 16000
-            assert config.transcription.mode == TranscriptionMode.OPENAI
-            assert config.controls.basic_key == "shift_r"
-            assert config.general.auto_paste is True
+        assert isinstance(config, ApplicationConfig)
+        assert config.audio.sample_rate == 16000
+        assert config.transcription.mode == TranscriptionMode.OPENAI
+        assert config.controls.basic_key == "shift_r"
+        assert config.general.auto_paste is True
 
-    def test_save_config(self):
+    def test_save_config(self, tmp_path):
         """Test save_config method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(tmp_path))
 
-            # Create a test config
-            config = ApplicationConfig()
+        # Create a test config
+        config = ApplicationConfig()
 
-            config_manager.save_config(config)
+        config_manager.save_config(config)
 
-            # Verify file was created
-            assert config_manager.config_file.exists()
+        # Verify file was created
+        assert config_manager.config_file.exists()
 
-            # Verify content
-            content = config_manager.config_file.read_text()
-            assert "[audio]" in content
-            assert "[transcription]" in content
-            assert "[controls]" in content
-            assert "[general]" in content
+        # Verify content
+        content = config_manager.config_file.read_text()
+        assert "[audio]" in content
+        assert "[transcription]" in content
+        assert "[controls]" in content
+        assert "[general]" in content
 
-    def test_create_default_config(self):
+    def test_create_default_config(self, tmp_path):
         """Test create_default_config method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(tmp_path))
 
-            config = config_manager.create_default_config()
+        config = config_manager.create_default_config()
 
-            assert isinstance(config, ApplicationConfig)
-            assert config_manager.config_file.exists()
+        assert isinstance(config, ApplicationConfig)
+        assert config_manager.config_file.exists()
 
-    def test_get_config_path(self):
+    def test_get_config_path(self, shared_tmp):
         """Test get_config_path method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(shared_tmp))
 
-            config_path = config_manager.get_config_path()
+        config_path = config_manager.get_config_path()
 
-            assert config_path == str(Path(temp_dir) / "config.ini")
+        assert config_path == str(shared_tmp / "config.ini")
 
-    def test_get_temp_directory(self):
+    def test_get_temp_directory(self, tmp_path):
         """Test get_temp_directory method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(tmp_path))
 
-            # Create a basic config file
-            config_content = """
-[general]
-auto_paste = true
-"""
-            config_file = Path(temp_dir) / "config.ini"
-            config_file.write_text(config_content)
+        config_file = tmp_path / "config.ini"
+        config_file.write_text(_GENERAL_INI)
 
-            temp_dir_path = config_manager.get_temp_directory()
+        temp_dir_path = config_manager.get_temp_directory()
 
-            # Should return the default temp directory
-            expected_temp_dir = str(Path.home() / ".voicerecorder" / "temp")
-            assert temp_dir_path == expected_temp_dir
+        # Should return the default temp directory
+        expected_temp_dir = str(Path.home() / ".voicerecorder" / "temp")
+        assert temp_dir_path == expected_temp_dir
 
-    def test_reset_to_defaults(self):
+    def test_reset_to_defaults(self, tmp_path):
         """Test reset_to_defaults method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
+        config_manager = ConfigManager(str(tmp_path))
 
-            # Create an existing config
-            config_content = """
-[audio]
-sample_rate = 8000
-"""
-            config_file = Path(temp_dir) / "config.ini"
-            config_file.write_text(config_content)
+        config_file = tmp_path / "config.ini"
+        config_file.write_text(_LOW_SAMPLE_RATE_INI)
 
-            # Reset to defaults
-            config = config_manager.reset_to_defaults()
+        # Reset to defaults
+        config = config_manager.reset_to_defaults()
 
-            # Verify it was reset to default values
-            assert config.audio_config.sample_rate == 16000  # Default value
+        # Verify it was reset to default values
+        assert config.audio_config.sample_rate == 16000  # Default value
 
-    def test_update_config(self):
+    def test_update_config(self, tmp_path):
         """Test update_config method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
-
-            # Create initial config
-            config = config_manager.create_default_config()
-
-            # Update with new values
-            updated_config = config_manager.update_config(
-                transcription_config={"mode": "local_whisper", "model_name": "base"},
-                audio_config={"sample_rate": 22050},
-            )
-
-            # Verify updates
-            assert updated_config.transcription.mode == TranscriptionMode.LOCAL
-            assert (
-                updated_config.transcription.local.whisper_model == "small"
-            )  # base should be converted to small
-            assert updated_config.audio.sample_rate == 22050
+        config_manager = ConfigManager(str(tmp_path))
+
+        # Create initial config
+        config = config_manager.create_default_config()
+
+        # Update with new values
+        updated_config = config_manager.update_config(
+            transcription_config={"mode": "local_whisper", "model_name": "base"},
+            audio_config={"sample_rate": 22050},
+        )
+
+        # Verify updates
+        assert updated_config.transcription.mode == TranscriptionMode.LOCAL
+        assert (
+            updated_config.transcription.local.whisper_model == "small"
+        )  # base should be converted to small
+        assert updated_config.audio.sample_rate == 22050
@@ -2,139 +2,129 @@
 Unit tests for hotkey components.
 """
 
-from unittest.mock import Mock, patch
+import re
+import sys
+import types
 
 import pytest
 
 from src.voice_recorder.infrastructure.hotkey import PynputHotkeyListener
+from tests.support.hotkey_mocks import MockHotkeyListener
 
+_FAKE_LISTENER = types.SimpleNamespace(start=lambda: None, stop=lambda: None)
+_FAKE_KEYBOARD = types.SimpleNamespace(Listener=lambda *args, **kwargs: _FAKE_LISTENER)
+_PYNPUT_MISSING = re.compile(r"Pynput library not available")
 
-class TestPynputHotkeyListener:
-    """Test cases for PynputHotkeyListener."""
 
-    def test_init_without_pynput(self):
-        """Test initialization when pynput is not available."""
-        with patch("builtins.__import__", side_effect=ImportError):
-            with pytest.raises(RuntimeError, match="Pynput library not available"):
-                PynputHotkeyListener()
+class Spy:
+    """Callable that counts its calls and remembers the last arguments."""
 
-    def test_init_with_pynput(self):
-        """Test initialization when pynput is available."""
-        mock_keyboard = Mock()
-        with patch("builtins.__import__", return_value=mock_keyboard):
-            listener = PynputHotkeyListener()
-            assert listener.keyboard is not None
+    def __init__(self):
+        self.n = 0
+        self.args = None
 
-    def test_start_listening(self):
-        """Test start_listening method."""
-        mock_keyboard = Mock()
-        mock_listener = Mock()
-        mock_keyboard.Listener.return_value = mock_listener
+    def __call__(self, *args):
+        self.n += 1
+        self.args = args
 
-        with patch("builtins.__import__", return_value=mock_keyboard):
-            listener = PynputHotkeyListener()
 
-            def on_press(key):
-                pass
+@pytest.fixture(autouse=True, scope="module")
+def _stub_pynput():
+    """Install a fake pynput package so the listener imports it directly."""
+    fake = types.ModuleType("pynput")
+    fake.keyboard = _FAKE_KEYBOARD
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "pynput", fake)
+        mp.setitem(sys.modules, "pynput.keyboard", fake.keyboard)
+        yield fake.keyboard
 
-            def on_release(key):
-                pass
 
-            # Set callbacks first
-            listener.set_callbacks(on_press, on_release)
-            listener.start_listening()
+@pytest.fixture
+def listener(_stub_pynput):
+    """Provide a listener built against the stubbed pynput."""
+    return PynputHotkeyListener()
 
-            assert listener.on_press_callback == on_press
-            assert listener.on_release_callback == on_release
-            # The Listener is created and started
-            assert listener.listener is not None
 
-    def test_stop_listening(self):
-        """Test stop_listening method."""
-        mock_keyboard = Mock()
-        mock_listener = Mock()
-        mock_keyboard.Listener.return_value = mock_listener
+class TestPynputHotkeyListener:
+    """Test cases for PynputHotkeyListener."""
 
-        with patch("builtins.__import__", return_value=mock_keyboard):
-            listener = PynputHotkeyListener()
-            listener.listener = mock_listener
+    def test_init_without_pynput(self, monkeypatch):
+        """Test initialization when pynput is not available."""
+        monkeypatch.setitem(sys.modules, "pynput", None)
+        with pytest.raises(RuntimeError, match=_PYNPUT_MISSING):
+            PynputHotkeyListener()
 
-            listener.stop_listening()
+    def test_init_with_pynput(self, _stub_pynput):
+        """Test initialization when pynput is available."""
+        listener = PynputHotkeyListener()
+        assert listener.keyboard is _stub_pynput
 
-            mock_listener.stop.assert_called_once()
-            assert listener.listener is None
+    def test_start_listening(self, listener):
+        """Test start_listening method."""
 
-    def test_on_press_handler(self):
-        """Test _on_press handler."""
-        mock_keyboard = Mock()
-        with patch("builtins.__import__", return_value=mock_keyboard):
-            listener = PynputHotkeyListener()
+        def on_press(key):
+            pass
 
-            mock_callback = Mock()
-            listener.on_press_callback = mock_callback
+        def on_release(key):
+            pass
 
-            test_key = Mock()
-            listener._on_press(test_key)
+        # Set callbacks first
+        listener.set_callbacks(on_press, on_release)
+        listener.start_listening()
 
-            mock_callback.assert_called_once_with(test_key)
+        assert listener.on_press_callback == on_press
+        assert listener.on_release_callback == on_release
+        # The Listener is created and started
+        assert listener.listener is _FAKE_LISTENER
 
-    def test_on_release_handler(self):
-        """Test _on_release handler."""
-        mock_keyboard = Mock()
-        with patch("builtins.__import__", return_value=mock_keyboard):
-            listener = PynputHotkeyListener()
+    def test_stop_listening(self, listener):
+        """Test stop_listening method."""
+        stop = Spy()
+        listener.listener = types.SimpleNamespace(stop=stop)
 
-            mock_callback = Mock()
-            listener.on_release_callback = mock_callback
+        listener.stop_listening()
 
-            test_key = Mock()
-            listener._on_release(test_key)
+        assert stop.n == 1 and stop.args == ()
+        assert listener.listener is None
 
-            mock_callback.assert_called_once_with(test_key)
+    def test_on_press_handler(self, listener):
+        """Test _on_press handler."""
+        callback = Spy()
+        listener.on_press_callback = callback
 
+        test_key = object()
+        listener._on_press(test_key)
 
-class MockHotkeyListener:
-    """Mock hotkey listener for testing."""
+        assert callback.n == 1 and callback.args == (test_key,)
 
-    def __init__(self):
-        self.is_listening = False
-        self.on_press_callback = None
-        self.on_release_callback = None
+    def test_on_release_handler(self, listener):
+        """Test _on_release handler."""
+        callback = Spy()
+        listener.on_release_callback = callback
 
-    def start_listening(self, on_press, on_release):
-        """Start listening for hotkey events."""
-        self.is_listening = True
-        self.on_press_callback = on_press
-        self.on_release_callback = on_release
+        test_key = object()
+        listener._on_release(test_key)
 
-    def stop_listening(self):
-        """Stop listening for hotkey events."""
-        self.is_listening = False
+        assert callback.n == 1 and callback.args == (test_key,)
 
-    def simulate_key_press(self, key):
-        """Simulate a key press event."""
-        if self.on_press_callback:
-            self.on_press_callback(key)
 
-    def simulate_key_release(self, key):
-        """Simulate a key release event."""
-        if self.on_release_callback:
-            self.on_release_callback(key)
+@pytest.fixture
+def mock_listener():
+    """Provide a fresh MockHotkeyListener."""
+    return MockHotkeyListener()
 
 
 class TestMockHotkeyListener:
     """Test cases for MockHotkeyListener."""
 
-    def test_init(self):
+    def test_init(self, mock_listener):
         """Test MockHotkeyListener initialization."""
-        listener = MockHotkeyListener()
-        assert listener.is_listening is False
-        assert listener.on_press_callback is None
-        assert listener.on_release_callback is None
+        assert mock_listener.is_listening is False
+        assert mock_listener.on_press_callback is None
+        assert mock_listener.on_release_callback is None
 
-    def test_start_listening(self):
+    def test_start_listening(self, mock_listener):
         """Test start_listening method."""
-        listener = MockHotkeyListener()
 
         def on_press(key):
             pass
@@ -142,41 +132,38 @@ class TestMockHotkeyListener:
         def on_release(key):
             pass
 
-        listener.start_listening(on_press, on_release)
+        mock_listener.start_listening(on_press, on_release)
 
-        assert listener.is_listening is True
-        assert listener.on_press_callback == on_press
-        assert listener.on_release_callback == on_release
+        assert mock_listener.is_listening is True
+        assert mock_listener.on_press_callback == on_press
+        assert mock_listener.on_release_callback == on_release
 
-    def test_stop_listening(self):
+    def test_stop_listening(self, mock_listener):
         """Test stop_listening method."""
-        listener = MockHotkeyListener()
-        listener.is_listening = True
+        mock_listener.is_listening = True
 
-        listener.stop_listening()
+        mock_listener.stop_listening()
 
-        assert listener.is_listening is False
+        assert mock_listener.is_listening is False
 
-    def test_simulate_key_press(self):
+    def test_simulate_key_press(self, mock_listener):
         """Test simulate_key_press method."""
-        listener = MockHotkeyListener()
-        mock_callback = Mock()
-        listener.on_press_callback = mock_callback
-        listener.is_listening = True
+        callback = Spy()
+        mock_listener.on_press_callback = callback
+        mock_listener.is_listening = True
 
-        test_key = Mock()
-        listener.simulate_key_press(test_key)
+        test_key = object()
+        mock_listener.simulate_key_press(test_key)
 
-        mock_callback.assert_called_once_with(test_key)
+        assert callback.n == 1 and callback.args == (test_key,)
 
-    def test_simulate_key_release(self):
+    def test_simulate_key_release(self, mock_listener):
         """Test simulate_key_release method."""
-        listener = MockHotkeyListener()
-        mock_callback = Mock()
-        listener.on_release_callback = mock_callback
-        listener.is_listening = True
+        callback = Spy()
+        mock_listener.on_release_callback = callback
+        mock_listener.is_listening = True
 
-        test_key = Mock()
-        listener.simulate_key_release(test_key)
+        test_key = object()
+        mock_listener.simulate_key_release(test_key)
 
-        mock_callback.assert_called_once_with(test_key)
+        assert callback.n == 1 and callback.args == (test_key,)
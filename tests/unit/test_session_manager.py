@@ -8,20 +8,31 @@ import pytest
 
 from src.voice_recorder.domain.models import RecordingSession, RecordingState
 from src.voice_recorder.infrastructure.session_manager import InMemorySessionManager
+from tests.support.session_mocks import MockSessionManager
+
+
+@pytest.fixture
+def manager():
+    """Provide an empty in-memory session manager."""
+    return InMemorySessionManager()
+
+
+@pytest.fixture
+def session_manager(manager):
+    """Provide an in-memory manager holding one freshly created session."""
+    return manager, manager.create_session()
 
 
 class TestInMemorySessionManager:
     """Test cases for InMemorySessionManager."""
 
-    def test_init(self):
+    def test_init(self, manager):
         """Test InMemorySessionManager initialization."""
-        manager = InMemorySessionManager()
         assert manager.sessions == {}
 
-    def test_create_session(self):
+    def test_create_session(self, session_manager):
         """Test session creation."""
-        manager = InMemorySessionManager()
-        session = manager.create_session()
+        manager, session = session_manager
 
         assert isinstance(session, RecordingSession)
         assert session.id is not None
@@ -29,35 +40,31 @@ class TestInMemorySessionManager:
         assert session.state == RecordingState.IDLE
         assert session.id in manager.sessions
 
-    def test_update_session(self):
-        """Test session update."""
-        manager = InMemorySessionManager()
-        session = manager.create_session()
-
-        # Update the session
-        session.state = RecordingState.RECORDING
-        manager.update_session(session)
-
-        updated_session = manager.get_session(session.id)
-        assert updated_session.state == RecordingState.RECORDING
-
-    def test_get_session_existing(self):
+    def test_get_session_existing(self, session_manager):
         """Test getting existing session."""
-        manager = InMemorySessionManager()
-        session = manager.create_session()
-
-        retrieved_session = manager.get_session(session.id)
-        assert retrieved_session == session
-
-    def test_get_session_non_existing(self):
-        """Test getting non-existing session."""
-        manager = InMemorySessionManager()
-        session = manager.get_session("non_existing_id")
-        assert session is None
-
-    def test_get_all_sessions(self):
+        manager, session = session_manager
+
+        assert manager.get_session(session.id) == session
+
+    @pytest.mark.parametrize(
+        "method,existing,expected",
+        [
+            pytest.param("get_session", False, None, id="get_missing"),
+            pytest.param("delete_session", True, True, id="delete_existing"),
+            pytest.param("delete_session", False, False, id="delete_missing"),
+        ],
+    )
+    def test_lookup_by_id(self, session_manager, method, existing, expected):
+        """Test id-based get/delete for existing and unknown sessions."""
+        manager, session = session_manager
+        session_id = session.id if existing else "non_existing_id"
+
+        assert getattr(manager, method)(session_id) == expected
+        if method == "delete_session":
+            assert session_id not in manager.sessions
+
+    def test_get_all_sessions(self, manager):
         """Test getting all sessions."""
-        manager = InMemorySessionManager()
         session1 = manager.create_session()
         session2 = manager.create_session()
 
@@ -66,24 +73,8 @@ class TestInMemorySessionManager:
         assert session1 in all_sessions
         assert session2 in all_sessions
 
-    def test_delete_session_existing(self):
-        """Test deleting existing session."""
-        manager = InMemorySessionManager()
-        session = manager.create_session()
-
-        result = manager.delete_session(session.id)
-        assert result is True
-        assert session.id not in manager.sessions
-
-    def test_delete_session_non_existing(self):
-        """Test deleting non-existing session."""
-        manager = InMemorySessionManager()
-        result = manager.delete_session("non_existing_id")
-        assert result is False
-
-    def test_clear_sessions(self):
+    def test_clear_sessions(self, manager):
         """Test clearing all sessions."""
-        manager = InMemorySessionManager()
         manager.create_session()
         manager.create_session()
 
@@ -91,61 +82,23 @@ class TestInMemorySessionManager:
         manager.clear_sessions()
         assert len(manager.sessions) == 0
 
+    @pytest.mark.parametrize(
+        "state",
+        [
+            RecordingState.RECORDING,
+            RecordingState.PROCESSING,
+            RecordingState.ERROR,
+            RecordingState.IDLE,
+        ],
+    )
+    def test_session_state_transition(self, session_manager, state):
+        """Test that a session state change is persisted by update_session."""
+        manager, session = session_manager
+
+        session.state = state
+        manager.update_session(session)
 
-class MockSessionManager:
-    """Mock session manager for testing."""
-
-    def __init__(self):
-        self.sessions = []
-        self.create_count = 0
-        self.update_count = 0
-        self.get_count = 0
-        self.delete_count = 0
-        self.clear_count = 0
-
-    def create_session(self) -> RecordingSession:
-        """Create a new recording session."""
-        self.create_count += 1
-        session_id = f"mock_session_{self.create_count}"
-        session = RecordingSession(
-            id=session_id, start_time=datetime.now(), state=RecordingState.IDLE
-        )
-        self.sessions.append(session)
-        return session
-
-    def update_session(self, session: RecordingSession) -> None:
-        """Update session information."""
-        self.update_count += 1
-        for i, existing_session in enumerate(self.sessions):
-            if existing_session.id == session.id:
-                self.sessions[i] = session
-                break
-
-    def get_session(self, session_id: str):
-        """Get session by ID."""
-        self.get_count += 1
-        for session in self.sessions:
-            if session.id == session_id:
-                return session
-        return None
-
-    def get_all_sessions(self):
-        """Get all sessions."""
-        return list(self.sessions)
-
-    def delete_session(self, session_id: str) -> bool:
-        """Delete a session."""
-        self.delete_count += 1
-        for i, session in enumerate(self.sessions):
-            if session.id == session_id:
-                del self.sessions[i]
-                return True
-        return False
-
-    def clear_sessions(self) -> None:
-        """Clear all sessions."""
-        self.clear_count += 1
-        self.sessions.clear()
+        assert manager.get_session(session.id).state == state
 
 
 class TestMockSessionManager:
@@ -154,7 +107,7 @@ class TestMockSessionManager:
     def test_init(self):
         """Test MockSessionManager initialization."""
         manager = MockSessionManager()
-        assert manager.sessions == []
+        assert manager.sessions == {}
         assert manager.create_count == 0
         assert manager.update_count == 0
 
@@ -180,6 +133,13 @@ class TestMockSessionManager:
         assert manager.create_count == 2
         assert len(manager.sessions) == 2
 
+    def test_create_session_uses_clock(self):
+        """Test that session start times come from the injected clock."""
+        start = datetime(2030, 6, 1, 12, 0)
+        manager = MockSessionManager(clock=lambda: start)
+
+        assert manager.create_session().start_time == start
+
     def test_update_session(self):
         """Test mock session update."""
         manager = MockSessionManager()
@@ -193,6 +153,16 @@ class TestMockSessionManager:
         updated_session = manager.get_session(session.id)
         assert updated_session.state == RecordingState.RECORDING
 
+    def test_update_unknown_session(self):
+        """Test that updating an unknown session does not add it."""
+        manager = MockSessionManager()
+        stranger = RecordingSession(id="unknown", start_time=datetime(2024, 1, 1))
+
+        manager.update_session(stranger)
+
+        assert manager.update_count == 1
+        assert manager.sessions == {}
+
     def test_get_session_existing(self):
         """Test getting existing mock session."""
         manager = MockSessionManager()
@@ -206,31 +176,3 @@ class TestMockSessionManager:
         manager = MockSessionManager()
         session = manager.get_session("non_existing_id")
         assert session is None
-
-    def test_session_state_transitions(self):
-        """Test session state transitions."""
-        manager = InMemorySessionManager()
-        session = manager.create_session()
-
-        # Initial state
-        assert session.state == RecordingState.IDLE
-
-        # Transition to recording
-        session.state = RecordingState.RECORDING
-        manager.update_session(session)
-        assert manager.get_session(session.id).state == RecordingState.RECORDING
-
-        # Transition to processing
-        session.state = RecordingState.PROCESSING
-        manager.update_session(session)
-        assert manager.get_session(session.id).state == RecordingState.PROCESSING
-
-        # Transition to error
-        session.state = RecordingState.ERROR
-        manager.update_session(session)
-        assert manager.get_session(session.id).state == RecordingState.ERROR
-
-        # Back to idle
-        session.state = RecordingState.IDLE
-        manager.update_session(session)
-        assert manager.get_session(session.id).state == RecordingState.IDLE
@@ -2,15 +2,67 @@
 Unit tests for text paster functionality.
 """
 
-import os
 import subprocess
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import call
 
 import pytest
 
 from src.voice_recorder.infrastructure.text_paster import MacOSTextPaster
 
 
+class _Recorder:
+    """Record calls to a subprocess entry point and return a canned result."""
+
+    def __init__(self, **result):
+        self._result = result
+        self.reset()
+
+    def reset(self):
+        """Forget recorded calls and restore the default result."""
+        self.calls = []
+        self.result = SimpleNamespace(**self._result)
+        self.error = None
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_subprocess():
+    """Replace subprocess.run and subprocess.Popen for the whole module."""
+    run = _Recorder(returncode=0, stdout="")
+    popen = _Recorder(returncode=0, communicate=lambda input=None: ("", ""))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(subprocess, "run", run)
+        mp.setattr(subprocess, "Popen", popen)
+        yield run, popen
+
+
+@pytest.fixture
+def subprocess_stubs(_stub_subprocess):
+    """Provide the (run, popen) recorders, reset for the current test."""
+    for recorder in _stub_subprocess:
+        recorder.reset()
+    return _stub_subprocess
+
+
+@pytest.fixture(scope="class")
+def _paster_instance():
+    """Build one stateless paster per test class."""
+    return MacOSTextPaster()
+
+
+@pytest.fixture
+def paster(_paster_instance, spy_console):
+    """Provide the shared paster wired to this test's console spy."""
+    _paster_instance.console = spy_console
+    return _paster_instance
+
+
 class TestMacOSTextPaster:
     """Test cases for MacOSTextPaster."""
 
@@ -19,85 +71,91 @@ class TestMacOSTextPaster:
         paster = MacOSTextPaster(console=mock_console)
         assert paster.console == mock_console
 
-    @patch("subprocess.run")
-    def test_paste_text(self, mock_run, mock_console):
+    def test_paste_text(self, paster, subprocess_stubs, spy_console):
         """Test paste_text method."""
-        mock_run.return_value = Mock(returncode=0)
+        run, _ = subprocess_stubs
 
-        paster = MacOSTextPaster(console=mock_console)
         paster.paste_text("Hello, world!")
 
-        mock_run.assert_called_once()
-        mock_console.info.assert_called_once_with("Text pasted successfully")
+        assert len(run.calls) == 1
+        assert spy_console.info.call_args_list == [call("Text pasted successfully")]
 
-    @patch("subprocess.run")
-    def test_paste_at_mouse_position(self, mock_run, mock_console):
+    def test_paste_at_mouse_position(self, paster, subprocess_stubs, spy_console):
         """Test paste_at_mouse_position method."""
-        mock_run.return_value = Mock(returncode=0)
+        run, _ = subprocess_stubs
 
-        paster = MacOSTextPaster(console=mock_console)
         paster.paste_at_mouse_position("Hello, world!")
 
         # Should be called once for the osascript command
-        assert mock_run.call_count == 1
-        mock_console.info.assert_called_once_with("Text pasted at mouse position")
-
-    @patch("subprocess.run")
-    def test_paste_text_with_mouse_position(self, mock_run, mock_console):
+        assert len(run.calls) == 1
+        assert spy_console.info.call_args_list == [
+            call("Text pasted at mouse position")
+        ]
+
+    def test_paste_text_with_mouse_position(
+        self, paster, subprocess_stubs, spy_console
+    ):
         """Test paste_text_with_mouse_position method."""
-        mock_run.return_value = Mock(returncode=0, stdout=b"100 200")
+        run, _ = subprocess_stubs
+        run.result.stdout = "100 200"
 
-        paster = MacOSTextPaster(console=mock_console)
         paster.paste_text_with_mouse_position("Hello, world!")
 
         # Should be called twice: once for getting mouse position, once for pasting
-        assert mock_run.call_count == 2
-        mock_console.info.assert_called_once_with("Text pasted at mouse position")
+        assert len(run.calls) == 2
+        assert spy_console.info.call_args_list == [
+            call("Text pasted at mouse position")
+        ]
 
-    @patch("subprocess.run")
-    def test_paste_text_error(self, mock_run, mock_console):
+    def test_paste_text_error(self, paster, subprocess_stubs, spy_console):
         """Test paste_text method with error."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "osascript")
+        run, _ = subprocess_stubs
+        run.error = subprocess.CalledProcessError(1, "osascript")
 
-        paster = MacOSTextPaster(console=mock_console)
         paster.paste_text("Hello, world!")
 
-        mock_console.error.assert_called_once_with(
-            "Text pasting failed: Command 'osascript' returned non-zero exit status 1."
-        )
+        assert spy_console.error.call_args_list == [
+            call(
+                "Text pasting failed: Command 'osascript' returned non-zero exit status 1."
+            )
+        ]
 
-    @patch("subprocess.run")
-    def test_paste_text_clipboard_failure(self, mock_run, mock_console):
+    def test_paste_text_clipboard_failure(self, paster, subprocess_stubs, spy_console):
         """Test paste_text method with clipboard failure."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "pbcopy")
+        _, popen = subprocess_stubs
+        popen.error = subprocess.CalledProcessError(1, "pbcopy")
 
-        paster = MacOSTextPaster(console=mock_console)
         paster.paste_text("Hello, world!")
 
-        mock_console.error.assert_called_once_with(
-            "Text pasting failed: Command 'pbcopy' returned non-zero exit status 1."
-        )
+        assert spy_console.error.call_args_list == [
+            call(
+                "Text pasting failed: Command 'pbcopy' returned non-zero exit status 1."
+            )
+        ]
 
-    @patch("subprocess.run")
-    def test_paste_text_with_position_mouse(self, mock_run, mock_console):
+    def test_paste_text_with_position_mouse(
+        self, paster, subprocess_stubs, spy_console
+    ):
         """Test paste_text_with_position method with mouse position."""
-        mock_run.return_value = Mock(returncode=0, stdout=b"100 200")
+        run, _ = subprocess_stubs
+        run.result.stdout = "100 200"
 
-        paster = MacOSTextPaster(console=mock_console)
         paster.paste_text_with_position("Hello, world!", position="mouse")
 
         # Should be called once for the osascript command
-        assert mock_run.call_count == 1
-        mock_console.info.assert_called_once_with("Text pasted at mouse position")
-
-    @patch("subprocess.run")
-    def test_paste_text_with_position_default(self, mock_run, mock_console):
+        assert len(run.calls) == 1
+        assert spy_console.info.call_args_list == [
+            call("Text pasted at mouse position")
+        ]
+
+    def test_paste_text_with_position_default(
+        self, paster, subprocess_stubs, spy_console
+    ):
         """Test paste_text_with_position method with default position."""
-        mock_run.return_value = Mock(returncode=0)
+        run, _ = subprocess_stubs
 
-        paster = MacOSTextPaster(console=mock_console)
         paster.paste_text_with_position("Hello, world!", position="default")
 
         # Should be called once for pasting
-        assert mock_run.call_count == 1
-        mock_console.info.assert_called_once_with("Text pasted successfully")
+        assert len(run.calls) == 1
+        assert spy_console.info.call_args_list == [call("Text pasted successfully")]
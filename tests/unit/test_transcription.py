@@ -2,37 +2,23 @@
 Unit tests for transcription services.
 """
 
-import os
-import tempfile
-from unittest.mock import Mock, patch
+import re
+import sys
+import types
+from unittest.mock import Mock
 
 import pytest
 
-from src.voice_recorder.domain.models import (
-    TranscriptionConfig,
-    TranscriptionMode,
-    TranscriptionResult,
-)
+from src.voice_recorder.domain.models import TranscriptionResult
 from src.voice_recorder.infrastructure.transcription.providers import (
     OpenAITranscriptionProvider,
 )
 from src.voice_recorder.infrastructure.transcription import SimpleTranscriptionService
-from src.voice_recorder.infrastructure.transcription.simple_factory import (
-    SimpleTranscriptionServiceFactory,
-)
-
-
-class MockTranscriptionService:
-    """Mock transcription service for testing."""
+from tests.support.transcription_mocks import MockTranscriptionService
 
-    def __init__(self, mock_text: str = "Test transcription"):
-        self.mock_text = mock_text
-
-    def transcribe(self, audio_file_path: str):
-        """Mock transcription method."""
-        from src.voice_recorder.domain.models import TranscriptionResult
-
-        return TranscriptionResult(text=self.mock_text, confidence=0.95, duration=1.0)
+_OPENAI_ERR = re.compile(r"OpenAI transcription failed: OpenAI error")
+_OPENAI_CONN_ERR = re.compile(r"OpenAI transcription failed: connection reset")
+_OPENAI_LIB_MISSING = re.compile(r"OpenAI library not available")
 
 
 class TestMockTranscriptionService:
@@ -48,136 +34,103 @@ class TestMockTranscriptionService:
         service = MockTranscriptionService("Test transcription")
         result = service.transcribe("dummy_file.wav")
 
-        assert isinstance(result, TranscriptionResult)
-        assert result.text == "Test transcription"
-        assert result.confidence == 0.95
+        assert result == TranscriptionResult(
+            text="Test transcription", confidence=0.95, duration=1.0
+        )
 
-        assert result.duration == 1.0
 
+@pytest.fixture
+def openai_client(_stub_openai):
+    """Provide the fake OpenAI client with recorded calls and results cleared."""
+    _stub_openai.reset_mock(return_value=True, side_effect=True)
+    return _stub_openai
 
+
+@pytest.mark.usefixtures("_stub_openai")
 class TestOpenAITranscriptionProvider:
     """Test cases for the new OpenAITranscriptionProvider."""
 
-    def test_init(self):
+    def test_init(self, openai_config):
         """Test initialization."""
-        from src.voice_recorder.domain.models import OpenAITranscriptionConfig
-
-        config = OpenAITranscriptionConfig(
-            api_key="test_key",
-            whisper_model="whisper-1",
-        )
-        provider = OpenAITranscriptionProvider(config)
-        assert provider.config.api_key == "test_key"
+        provider = OpenAITranscriptionProvider(openai_config.openai)
+        assert provider.config.api_key == "test-key"
         assert provider.config.whisper_model == "whisper-1"
 
-    def test_transcribe_file_not_found(self):
-        """Test transcribe with non-existent file."""
-        from src.voice_recorder.domain.models import OpenAITranscriptionConfig
-
-        config = OpenAITranscriptionConfig(
-            api_key="test_key",
-            whisper_model="whisper-1",
-        )
-        provider = OpenAITranscriptionProvider(config)
+    def test_init_without_openai(self, openai_config, monkeypatch):
+        """Test initialization when the openai library is not installed."""
+        monkeypatch.setitem(sys.modules, "openai", None)
 
-        with pytest.raises(FileNotFoundError):
-            provider.transcribe("non_existent_file.wav")
+        with pytest.raises(RuntimeError, match=_OPENAI_LIB_MISSING):
+            OpenAITranscriptionProvider(openai_config.openai)
 
-    def test_transcribe_success(self):
+    def test_transcribe_success(self, openai_config, openai_client, tmp_path):
         """Test successful transcription."""
-        from src.voice_recorder.domain.models import OpenAITranscriptionConfig
-
-        config = OpenAITranscriptionConfig(
-            api_key="test_key",
-            whisper_model="whisper-1",
-        )
-
-        # Mock the openai import in the provider's __init__ method
-        with patch("builtins.__import__") as mock_import:
-            # Setup mock for openai import
-            mock_openai = Mock()
-            mock_client = Mock()
-            mock_openai.OpenAI.return_value = mock_client
-
-            # Save the original import function
-            original_import = __import__
-
-            def import_side_effect(name, *args, **kwargs):
-                if name == "openai":
-                    return mock_openai
-                return original_import(name, *args, **kwargs)
-
-            mock_import.side_effect = import_side_effect
-
-            provider = OpenAITranscriptionProvider(config)
-
-            # Now mock the response for transcription
-            mock_response = Mock()
-            mock_response.text = "Hello world"
-            mock_client.audio.transcriptions.create.return_value = mock_response
-
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                temp_file = f.name
-                f.write(b"test_audio_data")
-
-            try:
-                result = provider.transcribe(temp_file)
-
-                assert hasattr(result, "text")
-                assert result.text == "Hello world"
-
-                # Verify OpenAI was called correctly
-                mock_client.audio.transcriptions.create.assert_called_once()
-                call_args = mock_client.audio.transcriptions.create.call_args
-                assert call_args[1]["model"] == "whisper-1"
-
-            finally:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+        provider = OpenAITranscriptionProvider(openai_config.openai)
 
-    def test_transcribe_openai_error(self):
-        """Test transcription with OpenAI error."""
-        from src.voice_recorder.domain.models import OpenAITranscriptionConfig
-
-        config = OpenAITranscriptionConfig(
-            api_key="test_key",
-            whisper_model="whisper-1",
+        openai_client.audio.transcriptions.create.return_value = types.SimpleNamespace(
+            text="Hello world"
         )
 
-        # Mock the openai import and client to raise an error
-        with patch("builtins.__import__") as mock_import:
-            # Setup mock for openai import
-            mock_openai = Mock()
-            mock_client = Mock()
-            mock_openai.OpenAI.return_value = mock_client
-            mock_client.audio.transcriptions.create.side_effect = Exception(
-                "OpenAI error"
-            )
-
-            # Save the original import function
-            original_import = __import__
-
-            def import_side_effect(name, *args, **kwargs):
-                if name == "openai":
-                    return mock_openai
-                return original_import(name, *args, **kwargs)
-
-            mock_import.side_effect = import_side_effect
-
-            provider = OpenAITranscriptionProvider(config)
-
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                temp_file = f.name
-                f.write(b"test_audio_data")
-
-            try:
-                with pytest.raises(RuntimeError, match="OpenAI transcription failed"):
-                    provider.transcribe(temp_file)
-            finally:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+        temp_file = tmp_path / "a.wav"
+        temp_file.write_bytes(b"")
+
+        result = provider.transcribe(str(temp_file))
+
+        assert result.model_dump() == {
+            "text": "Hello world",
+            "confidence": None,
+            "duration": None,
+        }
+
+        # Verify OpenAI was called correctly
+        openai_client.audio.transcriptions.create.assert_called_once()
+        call_args = openai_client.audio.transcriptions.create.call_args
+        assert call_args[1]["model"] == "whisper-1"
+
+    @pytest.mark.parametrize(
+        "error,expected_match",
+        [
+            pytest.param(
+                Exception("OpenAI error"),
+                _OPENAI_ERR,
+                id="api_error",
+            ),
+            pytest.param(
+                ConnectionError("connection reset"),
+                _OPENAI_CONN_ERR,
+                id="connection_error",
+            ),
+        ],
+    )
+    def test_transcribe_openai_error(
+        self, openai_config, openai_client, error, expected_match, tmp_path
+    ):
+        """Test that client errors are wrapped in a RuntimeError."""
+        provider = OpenAITranscriptionProvider(openai_config.openai)
+        openai_client.audio.transcriptions.create.side_effect = error
+
+        temp_file = tmp_path / "a.wav"
+        temp_file.write_bytes(b"")
+
+        with pytest.raises(RuntimeError, match=expected_match):
+            provider.transcribe(str(temp_file))
+
+
+@pytest.mark.usefixtures("_stub_openai")
+@pytest.mark.parametrize(
+    "make_transcriber",
+    [
+        pytest.param(
+            lambda config: OpenAITranscriptionProvider(config),
+            id="provider",
+        ),
+        pytest.param(lambda config: SimpleTranscriptionService(Mock()), id="service"),
+    ],
+)
+def test_transcribe_file_not_found(make_transcriber, openai_config):
+    """Test that transcribing a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        make_transcriber(openai_config.openai).transcribe("non_existent_file.wav")
 
 
 class TestSimpleTranscriptionService:
@@ -196,7 +149,7 @@ class TestSimpleTranscriptionService:
         assert service.text_processor == mock_processor
         assert service.console == mock_console
 
-    def test_transcribe_success(self):
+    def test_transcribe_success(self, tmp_path):
         """Test successful transcription."""
         mock_provider = Mock()
         mock_result = TranscriptionResult(
@@ -206,27 +159,14 @@ class TestSimpleTranscriptionService:
 
         service = SimpleTranscriptionService(mock_provider)
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_file = f.name
-            f.write(b"test_audio_data")
-
-        try:
-            result = service.transcribe(temp_file)
-            assert result.text == "Hello world"
-            mock_provider.transcribe.assert_called_once_with(temp_file)
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
-
-    def test_transcribe_file_not_found(self):
-        """Test transcription with non-existent file."""
-        mock_provider = Mock()
-        service = SimpleTranscriptionService(mock_provider)
+        temp_file = tmp_path / "a.wav"
+        temp_file.write_bytes(b"")
 
-        with pytest.raises(FileNotFoundError):
-            service.transcribe("non_existent_file.wav")
+        result = service.transcribe(str(temp_file))
+        assert result == mock_result
+        mock_provider.transcribe.assert_called_once_with(str(temp_file))
 
-    def test_transcribe_and_enhance_with_processor(self):
+    def test_transcribe_and_enhance_with_processor(self, tmp_path):
         """Test transcription with text enhancement."""
         mock_provider = Mock()
         mock_processor = Mock()
@@ -246,19 +186,18 @@ class TestSimpleTranscriptionService:
             mock_provider, mock_processor, mock_console
         )
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_file = f.name
-            f.write(b"test_audio_data")
+        temp_file = tmp_path / "a.wav"
+        temp_file.write_bytes(b"")
 
-        try:
-            result = service.transcribe_and_enhance(temp_file)
-            assert result.text == "Hello, world! This is improved."
-            mock_processor.process_text.assert_called_once_with("Hello world")
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+        result = service.transcribe_and_enhance(str(temp_file))
+        assert result.model_dump() == {
+            "text": "Hello, world! This is improved.",
+            "confidence": 0.95,
+            "duration": 1.0,
+        }
+        mock_processor.process_text.assert_called_once_with("Hello world")
 
-    def test_transcribe_and_enhance_without_processor(self):
+    def test_transcribe_and_enhance_without_processor(self, tmp_path):
         """Test transcription without text processor."""
         mock_provider = Mock()
         mock_result = TranscriptionResult(
@@ -268,56 +207,8 @@ class TestSimpleTranscriptionService:
 
         service = SimpleTranscriptionService(mock_provider)
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_file = f.name
-            f.write(b"test_audio_data")
-
-        try:
-            result = service.transcribe_and_enhance(temp_file)
-            assert result.text == "Hello world"
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
-
-
-class TestSimpleTranscriptionServiceFactory:
-    """Test cases for SimpleTranscriptionServiceFactory."""
-
-    def test_create_service_openai(self):
-        """Test creating OpenAI service."""
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            OpenAITranscriptionConfig,
-        )
-
-        config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(api_key="test-key"),
-        )
-
-        factory = SimpleTranscriptionServiceFactory()
-        service = factory.create_service(config)
-
-        assert isinstance(service, SimpleTranscriptionService)
-        assert service.transcription_provider is not None
-
-    def test_create_enhanced_service_openai(self):
-        """Test creating enhanced OpenAI service."""
-        from src.voice_recorder.domain.models import (
-            TranscriptionConfig,
-            TranscriptionMode,
-            OpenAITranscriptionConfig,
-        )
-
-        config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(api_key="test-key"),
-        )
-
-        factory = SimpleTranscriptionServiceFactory()
-        service = factory.create_enhanced_service(config)
+        temp_file = tmp_path / "a.wav"
+        temp_file.write_bytes(b"")
 
-        assert isinstance(service, SimpleTranscriptionService)
-        assert service.transcription_provider is not None
-        assert service.text_processor is not None
+        result = service.transcribe_and_enhance(str(temp_file))
+        assert result == mock_result
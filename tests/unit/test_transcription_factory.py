@@ -2,70 +2,75 @@
 Unit tests for transcription factory.
 """
 
+import re
+
 import pytest
-from unittest.mock import Mock, patch
 
-from src.voice_recorder.domain.models import (
-    TranscriptionConfig,
-    TranscriptionMode,
-    OpenAITranscriptionConfig,
-    LocalTranscriptionConfig,
-)
+from src.voice_recorder.domain.models import OpenAITranscriptionConfig
 from src.voice_recorder.infrastructure.transcription.simple_factory import (
     SimpleTranscriptionServiceFactory,
 )
+from src.voice_recorder.infrastructure.transcription.providers import (
+    OpenAITextProcessor,
+    OpenAITranscriptionProvider,
+)
 from src.voice_recorder.infrastructure.transcription.service import (
     SimpleTranscriptionService,
 )
 
+_NO_API_KEY = re.compile(r"OpenAI API key is required")
+_UNSUPPORTED_MODE = re.compile(r"Unsupported transcription mode")
+
+
+@pytest.fixture(scope="class")
+def factory() -> SimpleTranscriptionServiceFactory:
+    """Provide a factory shared by the tests in a class."""
+    return SimpleTranscriptionServiceFactory()
+
 
+@pytest.mark.usefixtures("_stub_openai")
 class TestSimpleTranscriptionServiceFactory:
     """Test cases for the new SimpleTranscriptionServiceFactory."""
 
-    def test_create_service_openai(self):
-        """Test creating OpenAI service with new factory."""
-        config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(
-                api_key="test-key", whisper_model="whisper-1"
+    @pytest.mark.parametrize(
+        "method,expected_cls,expects_processor",
+        [
+            pytest.param(
+                "create_service", SimpleTranscriptionService, False, id="service"
             ),
-        )
-
-        factory = SimpleTranscriptionServiceFactory()
-        service = factory.create_service(config)
-
-        assert isinstance(service, SimpleTranscriptionService)
-        assert service.transcription_provider is not None
-        assert service.text_processor is None  # Basic service has no text processor
-
-    def test_create_enhanced_service_openai(self):
-        """Test creating enhanced OpenAI service with new factory."""
-        config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(
-                api_key="test-key", whisper_model="whisper-1"
+            pytest.param(
+                "create_enhanced_service",
+                SimpleTranscriptionService,
+                True,
+                id="enhanced_service",
             ),
-        )
-
-        factory = SimpleTranscriptionServiceFactory()
-        service = factory.create_enhanced_service(config)
-
-        assert isinstance(service, SimpleTranscriptionService)
-        assert service.transcription_provider is not None
-        assert service.text_processor is not None  # Enhanced service has text processor
-
-    def test_create_custom_service(self):
+            pytest.param(
+                "create_transcription_provider",
+                OpenAITranscriptionProvider,
+                None,
+                id="transcription_provider",
+            ),
+            pytest.param(
+                "create_text_processor", OpenAITextProcessor, None, id="text_processor"
+            ),
+        ],
+    )
+    def test_create_openai(
+        self, factory, openai_config, method, expected_cls, expects_processor
+    ):
+        """Test each factory method builds the expected OpenAI component."""
+        result = getattr(factory, method)(openai_config)
+
+        assert isinstance(result, expected_cls)
+        if expects_processor is not None:
+            # Only the enhanced service carries a text processor
+            assert result.transcription_provider is not None
+            assert (result.text_processor is not None) is expects_processor
+
+    def test_create_custom_service(self, factory, openai_config):
         """Test creating custom service with specific providers."""
-        from src.voice_recorder.infrastructure.transcription.providers import (
-            OpenAITranscriptionProvider,
-            OpenAITextProcessor,
-        )
+        transcription_config = openai_config.openai
 
-        transcription_config = OpenAITranscriptionConfig(
-            api_key="test-key", whisper_model="whisper-1"
-        )
-
-        factory = SimpleTranscriptionServiceFactory()
         transcription_provider = OpenAITranscriptionProvider(transcription_config)
         text_processor = OpenAITextProcessor(transcription_config)
 
@@ -75,38 +80,19 @@ class TestSimpleTranscriptionServiceFactory:
         assert service.transcription_provider == transcription_provider
         assert service.text_processor == text_processor
 
-    def test_create_transcription_provider_openai(self):
-        """Test creating OpenAI transcription provider."""
-        config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(
-                api_key="test-key", whisper_model="whisper-1"
-            ),
-        )
-
-        factory = SimpleTranscriptionServiceFactory()
-        provider = factory.create_transcription_provider(config)
-
-        from src.voice_recorder.infrastructure.transcription.providers import (
-            OpenAITranscriptionProvider,
-        )
-
-        assert isinstance(provider, OpenAITranscriptionProvider)
-
-    def test_create_text_processor_openai(self):
-        """Test creating OpenAI text processor."""
-        config = TranscriptionConfig(
-            mode=TranscriptionMode.OPENAI,
-            openai=OpenAITranscriptionConfig(
-                api_key="test-key", whisper_model="whisper-1"
+    @pytest.mark.parametrize(
+        "update,pattern",
+        [
+            pytest.param(
+                {"openai": OpenAITranscriptionConfig()}, _NO_API_KEY, id="no_api_key"
             ),
-        )
-
-        factory = SimpleTranscriptionServiceFactory()
-        processor = factory.create_text_processor(config)
-
-        from src.voice_recorder.infrastructure.transcription.providers import (
-            OpenAITextProcessor,
-        )
-
-        assert isinstance(processor, OpenAITextProcessor)
+            pytest.param({"mode": "bad"}, _UNSUPPORTED_MODE, id="unsupported_mode"),
+        ],
+    )
+    def test_create_service_errors(self, factory, openai_config, update, pattern):
+        """Test invalid configurations are rejected when creating a service."""
+        # model_copy skips validation, so an unknown mode can be injected
+        config = openai_config.model_copy(update=update)
+
+        with pytest.raises(ValueError, match=pattern):
+            factory.create_service(config)